@@ -19,10 +19,13 @@
 
 __version__ = "1.0.0"
 
+from . import _win_timer  # noqa: F401
 from .async_rate_limiter import AsyncRateLimiter
 from .rate_limiter import RateLimiter
+from .rate_limiter_group import RateLimiterGroup
 
 __all__ = [
     "AsyncRateLimiter",
     "RateLimiter",
+    "RateLimiterGroup",
 ]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Stéphane Caron
+# Copyright 2023 Inria
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sleep until an absolute deadline of the performance counter.
+
+This module also provides a function to yield the CPU to other threads.
+
+On Linux, where Python's performance counter reads ``CLOCK_MONOTONIC``, we
+call ``clock_nanosleep`` with ``TIMER_ABSTIME`` directly so that the kernel
+wakes us up at the deadline itself, rather than after a relative duration
+computed from a clock reading that may already be stale. Other platforms fall
+back to a relative :func:`time.sleep`.
+"""
+
+import ctypes
+import errno
+import os
+import sys
+from time import get_clock_info, perf_counter, sleep
+from typing import Any, Callable, Optional
+
+CLOCK_MONOTONIC = 1
+TIMER_ABSTIME = 1
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_clock_nanosleep() -> Optional[Any]:
+    """Load ``clock_nanosleep`` from the C library, if applicable.
+
+    Returns:
+        Foreign function, or ``None`` if absolute sleeps are not available.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    implementation = get_clock_info("perf_counter").implementation
+    if implementation != "clock_gettime(CLOCK_MONOTONIC)":
+        return None
+    try:
+        libc = ctypes.CDLL(None)  # symbols already loaded in the process
+        clock_nanosleep = libc.clock_nanosleep
+    except (AttributeError, OSError):
+        return None
+    clock_nanosleep.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.POINTER(_Timespec),
+        ctypes.POINTER(_Timespec),
+    ]
+    clock_nanosleep.restype = ctypes.c_int
+    return clock_nanosleep
+
+
+_clock_nanosleep = _load_clock_nanosleep()
+
+
+def _sleep_until_abstime(deadline: float) -> None:
+    """Sleep until a given time of the performance counter.
+
+    Args:
+        deadline: Wake-up time, in seconds, in the same reference as
+            :func:`time.perf_counter`.
+    """
+    seconds = int(deadline)
+    request = _Timespec(seconds, int((deadline - seconds) * 1e9))
+    while (
+        _clock_nanosleep(CLOCK_MONOTONIC, TIMER_ABSTIME, request, None)
+        == errno.EINTR
+    ):
+        pass  # interrupted by a signal handler, resume sleeping
+
+
+def _sleep_until_relative(deadline: float) -> None:
+    """Sleep until a given time of the performance counter.
+
+    Args:
+        deadline: Wake-up time, in seconds, in the same reference as
+            :func:`time.perf_counter`.
+    """
+    duration = deadline - perf_counter()
+    if duration > 0.0:
+        sleep(duration)
+
+
+if _clock_nanosleep is not None:
+    sleep_until = _sleep_until_abstime
+else:  # fallback
+    sleep_until = _sleep_until_relative
+
+
+def _sleep_zero() -> None:
+    """Yield the CPU to other threads with a zero-duration sleep."""
+    sleep(0.0)
+
+
+def _load_yield_cpu() -> Callable[[], Any]:
+    """Get the cheapest way to yield the CPU on this platform.
+
+    Returns:
+        Function that gives up the CPU to other ready threads, if any, and
+        returns right away otherwise.
+    """
+    if hasattr(os, "sched_yield"):
+        return os.sched_yield
+    if sys.platform == "win32":
+        try:
+            return ctypes.windll.kernel32.SwitchToThread  # type: ignore
+        except (AttributeError, OSError):
+            pass
+    return _sleep_zero
+
+
+yield_cpu = _load_yield_cpu()
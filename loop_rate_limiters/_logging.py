@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Stéphane Caron
+# Copyright 2023 Inria
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Logging shared by all rate limiters."""
+
+import logging
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .async_rate_limiter import AsyncRateLimiter
+    from .rate_limiter import RateLimiter
+
+logger = logging.getLogger("loop_rate_limiters")
+
+MAX_WARN_SKIP = 1024
+
+
+def warn_late(
+    limiter: Union["AsyncRateLimiter", "RateLimiter"], slack: float
+) -> None:
+    """Warn that a call came late, with exponential backoff.
+
+    Under sustained overruns, warnings are logged after 1, 2, 4, ... late
+    cycles, up to one every 1024 cycles. The backoff is reset by the first
+    cycle that comes on time.
+
+    Args:
+        limiter: Rate limiter whose call came late.
+        slack: Slack duration of the late call, in seconds.
+    """
+    if limiter._warn_counter < limiter._warn_skip:
+        limiter._warn_counter += 1
+        return
+    limiter._warn_counter = 0
+    limiter._warn_skip = min(2 * limiter._warn_skip or 1, MAX_WARN_SKIP)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning("%s is late by %.1f [ms]", limiter.name, 1e3 * slack)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Stéphane Caron
+# Copyright 2023 Inria
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Raise the resolution of the system timer on Windows.
+
+The default timer resolution on Windows is about 15.6 ms, which is coarser
+than the period of most loops we want to regulate. Importing this module
+requests a 1 ms resolution via ``timeBeginPeriod`` for the lifetime of the
+process. It does nothing on other platforms.
+"""
+
+import atexit
+import sys
+
+TIMER_RESOLUTION_MS = 1
+
+
+def _begin_period() -> None:
+    """Request a 1 ms timer resolution until the interpreter exits."""
+    import ctypes  # pylint: disable=import-outside-toplevel
+
+    try:
+        winmm = ctypes.WinDLL("winmm")  # type: ignore[attr-defined]
+    except OSError:
+        return
+    if winmm.timeBeginPeriod(TIMER_RESOLUTION_MS) == 0:  # TIMERR_NOERROR
+        atexit.register(winmm.timeEndPeriod, TIMER_RESOLUTION_MS)
+
+
+if sys.platform == "win32":
+    _begin_period()
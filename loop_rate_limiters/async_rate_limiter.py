@@ -26,7 +26,8 @@ duration.
 """
 
 import asyncio
-import logging
+
+from ._logging import warn_late
 
 
 class AsyncRateLimiter:
@@ -52,12 +53,31 @@ class AsyncRateLimiter:
             exceeded the rate clock.
     """
 
-    __last_loop_time: float
-    __loop: asyncio.AbstractEventLoop
-    __measured_period: float
-    __next_tick: float
-    __period: float
-    __slack: float
+    __slots__ = (
+        "_frequency",
+        "_last_loop_time",
+        "_late_threshold",
+        "_loop",
+        "_next_tick",
+        "_period",
+        "_prev_loop_time",
+        "_slack",
+        "_warn_counter",
+        "_warn_skip",
+        "name",
+        "warn",
+    )
+
+    _frequency: float
+    _last_loop_time: float
+    _late_threshold: float
+    _loop: asyncio.AbstractEventLoop
+    _next_tick: float
+    _period: float
+    _prev_loop_time: float
+    _slack: float
+    _warn_counter: int
+    _warn_skip: int
     name: str
     warn: bool
 
@@ -71,45 +91,55 @@ class AsyncRateLimiter:
             name: Human-readable name used for logging.
             warn: If set (default), warn when the time between two calls
                 exceeded the rate clock.
+
+        Raises:
+            RuntimeError: If there is no running event loop.
+            ValueError: If the frequency is not positive.
         """
-        loop = asyncio.get_event_loop()
+        if not frequency > 0.0:
+            raise ValueError(f"frequency must be positive, got {frequency}")
+        loop = asyncio.get_running_loop()
+        frequency = float(frequency)
         period = 1.0 / frequency
-        if not loop.is_running() and warn:
-            logging.warning(
-                "asyncio loop does not seem to be running for %s",
-                self.name,
-            )
-        self.__last_loop_time = loop.time()
-        self.__loop = loop
-        self.__measured_period = 0.0
-        self.__next_tick = loop.time() + period
-        self.__period = period
-        self.__slack = 0.0
+        now = loop.time()
+        self._frequency = frequency
+        self._last_loop_time = now
+        self._loop = loop
+        self._late_threshold = -0.1 * period
+        self._next_tick = now + period
+        self._period = period
+        self._prev_loop_time = now
+        self._slack = 0.0
+        self._warn_counter = 0
+        self._warn_skip = 0
         self.name = name
         self.warn = warn
 
     @property
-    def dt(self) -> float:
-        """Desired period between two calls to :func:`sleep`, in seconds."""
-        return self.__period
+    def frequency(self) -> float:
+        """Desired frequency of calls to :func:`sleep`, in hertz."""
+        return self._frequency
 
     @property
     def measured_period(self) -> float:
         """Period measured at the end of the last call to :func:`sleep`.
 
-        This duration is in seconds.
+        This duration is in seconds. It is computed from the loop times
+        recorded at the end of the last two calls.
         """
-        return self.__measured_period
+        return self._last_loop_time - self._prev_loop_time
 
     @property
     def next_tick(self) -> float:
         """Time of next clock tick."""
-        return self.__next_tick
+        return self._next_tick
 
     @property
     def period(self) -> float:
         """Desired period between two calls to :func:`sleep`, in seconds."""
-        return self.__period
+        return self._period
+
+    dt = period
 
     @property
     def slack(self) -> float:
@@ -117,7 +147,7 @@ class AsyncRateLimiter:
 
         This duration is in seconds.
         """
-        return self.__slack
+        return self._slack
 
     async def remaining(self) -> float:
         """Get the time remaining until the next expected clock tick.
@@ -125,7 +155,7 @@ class AsyncRateLimiter:
         Returns:
             Time remaining, in seconds, until the next expected clock tick.
         """
-        return self.__next_tick - self.__loop.time()
+        return self._next_tick - self._loop.time()
 
     async def sleep(self, block_duration: float = 5e-4):
         """Sleep the duration required to regulate the loop frequency.
@@ -145,20 +175,66 @@ class AsyncRateLimiter:
         period much closer to the desired one (< 2% average error vs. 8-12%
         average error with a single asyncio.sleep). Empirically a block
         duration of 0.5 ms gives good behavior at 400 Hz or lower.
+
+        The non-blocking part of the period is spent awaiting a single timer
+        scheduled at the start of the block window, so that the event loop is
+        not woken up repeatedly while other tasks run.
+        """
+        loop = self._loop
+        loop_time = loop.time
+        next_tick = self._next_tick
+        slack = next_tick - loop_time()
+        self._slack = slack
+        if slack > 0.0:
+            if self._warn_skip:
+                self._warn_skip = self._warn_counter = 0
+            block_time = next_tick - block_duration
+            if loop_time() < block_time:
+                # Single timer wakeup at the start of the block window
+                fut = loop.create_future()
+                handle = loop.call_at(block_time, fut.set_result, None)
+                try:
+                    await fut
+                finally:
+                    handle.cancel()
+            while loop_time() < block_time:
+                # Timers may fire up to the loop's clock resolution early
+                await asyncio.sleep(0)
+            while loop_time() < next_tick:
+                pass  # block the event loop until the next tick
+        elif self.warn and slack < self._late_threshold:
+            warn_late(self, slack)
+        now = loop_time()
+        self._prev_loop_time = self._last_loop_time
+        self._last_loop_time = now
+        self._next_tick = now + self._period
+
+    async def sleep_until_next_tick(self):
+        """Sleep until the next clock tick without blocking the event loop.
+
+        This function is meant to be called once per loop cycle, as an
+        alternative to :func:`sleep`. It awaits a single timer scheduled at
+        the next tick, so that it costs one event loop wakeup per cycle and
+        never blocks. This is the preferred way to regulate loops that don't
+        need the period accuracy brought by the block duration of
+        :func:`sleep`.
         """
-        self.__slack = self.__next_tick - self.__loop.time()
-        if self.__slack > 0.0:
-            block_time = self.__next_tick - block_duration
-            while self.__loop.time() < self.__next_tick:
-                if self.__loop.time() < block_time:
-                    await asyncio.sleep(1e-5)  # non-zero sleep duration
-        elif self.__slack < -0.1 * self.__period and self.warn:
-            logging.warning(
-                "%s is late by %f [ms]",
-                self.name,
-                round(1e3 * self.__slack, 1),
-            )
-        loop_time = self.__loop.time()
-        self.__measured_period = loop_time - self.__last_loop_time
-        self.__last_loop_time = loop_time
-        self.__next_tick = loop_time + self.__period
+        loop = self._loop
+        next_tick = self._next_tick
+        slack = next_tick - loop.time()
+        self._slack = slack
+        if slack > 0.0:
+            if self._warn_skip:
+                self._warn_skip = self._warn_counter = 0
+            fut = loop.create_future()
+            handle = loop.call_at(next_tick, fut.set_result, None)
+            try:
+                await fut
+            finally:
+                handle.cancel()
+        elif self.warn and slack < self._late_threshold:
+            warn_late(self, slack)
+        now = loop.time()
+        self._prev_loop_time = self._last_loop_time
+        self._last_loop_time = now
+        self._next_tick = now + self._period
@@ -18,8 +18,11 @@
 
 """Basic rate limiter."""
 
-import logging
-from time import perf_counter, sleep
+from time import perf_counter
+from typing import Optional
+
+from ._clock import sleep_until, yield_cpu
+from ._logging import warn_late
 
 
 class RateLimiter:
@@ -33,15 +36,50 @@ class RateLimiter:
     .. _rospy.Rate:
         https://github.com/ros/ros_comm/blob/noetic-devel/clients/rospy/src/rospy/timer.py
 
+    In adaptive mode, the period is adjusted at each call by additive
+    decrease when calls come on time, and multiplicative increase when they
+    come late, like AIMD congestion control. This lets the loop settle at the
+    fastest rate its workload can sustain, between a minimum and maximum
+    period.
+
     Attributes:
+        adaptive: If set, adapt the period to the measured slack.
         name: Human-readable name used for logging.
         warn: If set (default), warn when the time between two calls
             exceeded the rate clock.
     """
 
-    __period: float
-    __slack: float
-    __next_tick: float
+    __slots__ = (
+        "_alpha",
+        "_beta",
+        "_frequency",
+        "_late_threshold",
+        "_max_period",
+        "_min_period",
+        "_next_tick",
+        "_period",
+        "_slack",
+        "_target_frequency",
+        "_warn_counter",
+        "_warn_skip",
+        "adaptive",
+        "name",
+        "warn",
+    )
+
+    _alpha: float
+    _beta: float
+    _frequency: float
+    _late_threshold: float
+    _max_period: float
+    _min_period: float
+    _next_tick: float
+    _period: float
+    _slack: float
+    _target_frequency: float
+    _warn_counter: int
+    _warn_skip: int
+    adaptive: bool
     name: str
     warn: bool
 
@@ -50,6 +88,11 @@ class RateLimiter:
         frequency: float,
         name: str = "rate limiter",
         warn: bool = True,
+        adaptive: bool = False,
+        alpha: Optional[float] = None,
+        beta: float = 0.5,
+        min_period: Optional[float] = None,
+        max_period: Optional[float] = None,
     ):
         """Initialize rate limiter.
 
@@ -58,28 +101,81 @@ class RateLimiter:
             name: Human-readable name used for logging.
             warn: If set (default), warn when the time between two calls
                 exceeded the rate clock.
+            adaptive: If set, adapt the period to the measured slack.
+            alpha: Additive decrease of the period after an on-time call in
+                adaptive mode, in seconds. Defaults to 1% of the desired
+                period.
+            beta: Multiplicative factor, between zero and one, applied to the
+                frequency after a late call in adaptive mode.
+            min_period: Minimum period in adaptive mode, in seconds. Defaults
+                to the desired period.
+            max_period: Maximum period in adaptive mode, in seconds. Defaults
+                to ten times the desired period. The desired period must lie
+                between the minimum and maximum periods.
+
+        Raises:
+            ValueError: If the frequency is not positive, or if adaptive
+                parameters are out of their valid ranges.
         """
+        if not frequency > 0.0:
+            raise ValueError(f"frequency must be positive, got {frequency}")
+        frequency = float(frequency)
         period = 1.0 / frequency
-        self.__next_tick = perf_counter() + period
-        self.__period = period
-        self.__slack = 0.0
+        if alpha is None:
+            alpha = 0.01 * period
+        if max_period is None:
+            max_period = 10.0 * period
+        if min_period is None:
+            min_period = period
+        if not 0.0 < beta < 1.0:
+            raise ValueError(f"beta must be in (0, 1), got {beta}")
+        if not alpha >= 0.0:
+            raise ValueError(f"alpha must be non-negative, got {alpha}")
+        if not 0.0 < min_period <= period <= max_period:
+            raise ValueError(
+                "periods must satisfy 0 < min_period <= 1 / frequency <= "
+                f"max_period, got min_period={min_period}, "
+                f"1 / frequency={period} and max_period={max_period}"
+            )
+        self._alpha = alpha
+        self._beta = beta
+        self._frequency = frequency
+        self._max_period = max_period
+        self._min_period = min_period
+        self._target_frequency = frequency
+        self._late_threshold = -0.1 * period
+        self._next_tick = perf_counter() + period
+        self._period = period
+        self._slack = 0.0
+        self._warn_counter = 0
+        self._warn_skip = 0
+        self.adaptive = adaptive
         self.name = name
         self.warn = warn
 
     @property
-    def dt(self) -> float:
-        """Desired period between two calls to :func:`sleep`, in seconds."""
-        return self.__period
+    def frequency(self) -> float:
+        """Desired frequency of calls to :func:`sleep`, in hertz.
+
+        In adaptive mode, this is the frequency of the current period.
+        """
+        return self._frequency
 
     @property
     def next_tick(self) -> float:
         """Time of next clock tick."""
-        return self.__next_tick
+        return self._next_tick
 
     @property
     def period(self) -> float:
-        """Desired period between two calls to :func:`sleep`, in seconds."""
-        return self.__period
+        """Desired period between two calls to :func:`sleep`, in seconds.
+
+        In adaptive mode, this is the current period, which may differ from
+        the one corresponding to :attr:`target_frequency`.
+        """
+        return self._period
+
+    dt = period
 
     @property
     def slack(self) -> float:
@@ -87,25 +183,120 @@ class RateLimiter:
 
         This duration is in seconds.
         """
-        return self.__slack
+        return self._slack
+
+    @property
+    def target_frequency(self) -> float:
+        """Frequency the rate limiter was initialized with, in hertz."""
+        return self._target_frequency
+
+    def _adapt_period(self, slack: float) -> float:
+        """Update the period from the slack of the last call.
+
+        Args:
+            slack: Slack duration of the last call, in seconds.
+
+        Returns:
+            New period, in seconds.
+        """
+        period = self._period
+        if slack > 0.0:
+            period = max(self._min_period, period - self._alpha)
+        elif slack < self._late_threshold:
+            period = min(self._max_period, period / self._beta)
+        else:  # late but within tolerance
+            return period
+        self._frequency = 1.0 / period
+        self._late_threshold = -0.1 * period
+        self._period = period
+        return period
 
-    def remaining(self) -> float:
+    def _skip(self, now: float, slack: float) -> None:
+        """Reschedule the next tick after a call that came late.
+
+        Args:
+            now: Time at which the call was made.
+            slack: Slack duration of the call, in seconds.
+        """
+        if self.warn and slack < self._late_threshold:
+            warn_late(self, slack)
+        period = self._adapt_period(slack) if self.adaptive else self._period
+        self._next_tick = now + period
+
+    def remaining(self, _perf_counter=perf_counter) -> float:
         """Get the time remaining until the next expected clock tick.
 
         Returns:
             Time remaining, in seconds, until the next expected clock tick.
         """
-        return self.__next_tick - perf_counter()
-
-    def sleep(self):
-        """Sleep for the duration required to regulate inter-call frequency."""
-        self.__slack = self.__next_tick - perf_counter()
-        if self.__slack > 0.0:
-            sleep(self.__slack)
-        elif self.__slack < -0.1 * self.period and self.warn:
-            logging.warning(
-                "%s is late by %f [ms]",
-                self.name,
-                round(1e3 * self.__slack, 1),
-            )
-        self.__next_tick = perf_counter() + self.__period
+        return self._next_tick - _perf_counter()
+
+    def sleep(self, _perf_counter=perf_counter, _sleep_until=sleep_until):
+        """Sleep for the duration required to regulate inter-call frequency.
+
+        Clock ticks are spaced by exactly one period as long as calls come on
+        time, so that late wake-ups from the operating system don't shift
+        subsequent ticks. When a call comes after its tick, the next tick is
+        rescheduled one period from now.
+
+        Note:
+            Underscored arguments are not meant to be passed. Their defaults
+            turn module functions into local variables, which are faster to
+            look up in this hot path.
+        """
+        period = self._period
+        next_tick = self._next_tick
+        now = _perf_counter()
+        slack = next_tick - now
+        self._slack = slack
+        if slack > 0.0:
+            if self._warn_skip:
+                self._warn_skip = self._warn_counter = 0
+            _sleep_until(next_tick)
+            if self.adaptive:
+                period = self._adapt_period(slack)
+            self._next_tick = next_tick + period
+        else:  # overrun: skip the sleep and don't read the clock again
+            self._skip(now, slack)
+
+    def sleep_precise(
+        self,
+        block_duration: float = 5e-4,
+        _perf_counter=perf_counter,
+        _sleep_until=sleep_until,
+        _yield_cpu=yield_cpu,
+    ):
+        """Sleep for the duration required to regulate inter-call frequency.
+
+        This function is a more accurate alternative to :func:`sleep`. It
+        sleeps until ``block_duration`` seconds before the next tick, then
+        spins until the tick while yielding the CPU to other ready threads
+        (with ``sched_yield`` or ``SwitchToThread``). Wake-ups are then
+        accurate down to the resolution of the performance counter, rather
+        than that of the operating system scheduler.
+
+        Args:
+            block_duration: Duration in seconds, before the next tick, during
+                which we spin rather than sleep.
+
+        Note:
+            Spinning keeps a CPU core busy for up to ``block_duration``
+            seconds per period.
+        """
+        period = self._period
+        next_tick = self._next_tick
+        now = _perf_counter()
+        slack = next_tick - now
+        self._slack = slack
+        if slack > 0.0:
+            if self._warn_skip:
+                self._warn_skip = self._warn_counter = 0
+            if slack > block_duration:
+                _sleep_until(next_tick - block_duration)
+            while _perf_counter() < next_tick:
+                _yield_cpu()
+            if self.adaptive:
+                period = self._adapt_period(slack)
+            self._next_tick = next_tick + period
+        else:  # overrun: skip the sleep and don't read the clock again
+            self._skip(now, slack)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Stéphane Caron
+# Copyright 2023 Inria
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rate limiter for a group of loops running at different frequencies."""
+
+from time import perf_counter
+from typing import Iterable, List
+
+from ._clock import sleep_until
+
+# Ticks closer than this duration, in seconds, are considered simultaneous
+_TICK_TOLERANCE = 1e-7
+
+
+class RateLimiterGroup:
+    """Regulate several loops, running at different frequencies, at once.
+
+    This is a more efficient alternative to calling the :func:`sleep`
+    functions of several :class:`RateLimiter` instances in the same thread.
+    Clock ticks of all loops are stored in a single list, so that each call
+    to :func:`sleep` reads the performance counter once and sleeps once, until
+    the nearest tick of the group.
+
+    The tick of each loop is computed as an integer number of periods after
+    its origin, rather than by summing periods, so that ticks of loops with
+    commensurate periods keep coinciding (up to rounding) over time.
+
+    Example:
+        .. code:: python
+
+            group = RateLimiterGroup([1000.0, 100.0])
+            while True:
+                for i in group.sleep():
+                    callbacks[i]()
+    """
+
+    __slots__ = (
+        "_counts",
+        "_next_ticks",
+        "_origins",
+        "_periods",
+    )
+
+    _counts: List[int]
+    _next_ticks: List[float]
+    _origins: List[float]
+    _periods: List[float]
+
+    def __init__(self, frequencies: Iterable[float]):
+        """Initialize rate limiter group.
+
+        Args:
+            frequencies: Desired frequencies of each loop, in hertz.
+
+        Raises:
+            ValueError: If there is no frequency or one is not positive.
+        """
+        frequencies = list(frequencies)
+        if not frequencies:
+            raise ValueError("rate limiter group needs at least one frequency")
+        for frequency in frequencies:
+            if not frequency > 0.0:
+                raise ValueError(
+                    f"frequencies must be positive, got {frequency}"
+                )
+        now = perf_counter()
+        periods = [1.0 / frequency for frequency in frequencies]
+        self._counts = [1 for _ in periods]
+        self._next_ticks = [now + period for period in periods]
+        self._origins = [now for _ in periods]
+        self._periods = periods
+
+    def __len__(self) -> int:
+        """Number of loops in the group."""
+        return len(self._periods)
+
+    @property
+    def next_ticks(self) -> List[float]:
+        """Times of next clock ticks of each loop."""
+        return list(self._next_ticks)
+
+    @property
+    def periods(self) -> List[float]:
+        """Desired periods of each loop, in seconds."""
+        return list(self._periods)
+
+    def sleep(
+        self, _perf_counter=perf_counter, _sleep_until=sleep_until
+    ) -> List[int]:
+        """Sleep until the nearest clock tick of the group.
+
+        This function is meant to be called once per cycle of the fastest
+        loop. Like :func:`RateLimiter.sleep`, the ticks of a loop are spaced
+        by exactly one period as long as it is on time, and rescheduled one
+        period from now when it is overdue by a full period or more.
+
+        Returns:
+            Indices of the loops whose clock tick is due.
+
+        Note:
+            Underscored arguments are local bindings and not meant to be
+            passed, as in :func:`RateLimiter.sleep`.
+        """
+        counts = self._counts
+        next_ticks = self._next_ticks
+        origins = self._origins
+        periods = self._periods
+        now = _perf_counter()
+        nearest = min(next_ticks)
+        if nearest > now:
+            _sleep_until(nearest)
+            now = nearest
+        due = []
+        horizon = now + _TICK_TOLERANCE
+        for i, next_tick in enumerate(next_ticks):
+            if next_tick <= horizon:
+                count = counts[i] + 1
+                next_tick = origins[i] + count * periods[i]
+                if next_tick <= horizon:  # overdue, rebase from now
+                    count = 1
+                    origins[i] = now
+                    next_tick = now + periods[i]
+                counts[i] = count
+                next_ticks[i] = next_tick
+                due.append(i)
+        return due
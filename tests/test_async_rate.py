@@ -20,11 +20,31 @@ Test asyncio rate limiter.
 """
 
 import asyncio
+import time
+import types
 import unittest
 
 from loop_rate_limiters import AsyncRateLimiter
 
 
+@types.coroutine
+def count_wakeups(coro, wakeups):
+    """Await a coroutine while counting how many times it is resumed.
+
+    Args:
+        coro: Coroutine to await.
+        wakeups: Single-element list where the count is accumulated.
+    """
+    value = None
+    while True:
+        wakeups[0] += 1
+        try:
+            yielded = coro.send(value)
+        except StopIteration as stop:
+            return stop.value
+        value = yield yielded
+
+
 class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         """
@@ -38,10 +58,27 @@ class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
         """
         self.assertIsNotNone(self.rate)
 
+    def test_frequency(self):
+        """Frequency matches the period."""
+        self.assertAlmostEqual(self.rate.frequency, 1000.0)
+
+    async def test_invalid_frequency(self):
+        """Frequencies must be positive."""
+        for frequency in (-1.0, 0.0, float("nan")):
+            with self.assertRaises(ValueError):
+                AsyncRateLimiter(frequency)
+
     def test_period_dt(self):
         """Check that period and dt are the same."""
         self.assertAlmostEqual(self.rate.period, self.rate.dt)
 
+    async def test_measured_period(self):
+        """Measured period is zero initially and positive after two calls."""
+        self.assertEqual(self.rate.measured_period, 0.0)
+        await self.rate.sleep()
+        await self.rate.sleep()
+        self.assertGreater(self.rate.measured_period, 0.0)
+
     async def test_remaining(self):
         """
         After one period has expired, the "remaining" time becomes negative.
@@ -69,3 +106,29 @@ class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
         await self.rate.sleep()  # presumably slack > 0.0
         await asyncio.sleep(self.rate.period)
         await self.rate.sleep()  # now for sure slack < 0.0
+
+    @unittest.skipIf(
+        time.get_clock_info("monotonic").resolution > 1e-3,
+        "event loop timers may fire a whole clock resolution early",
+    )
+    async def test_sleep_wakeups(self):
+        """The coroutine wakes up a bounded number of times per sleep."""
+        rate = AsyncRateLimiter(frequency=100.0)
+        wakeups = [0]
+        await count_wakeups(rate.sleep(), wakeups)
+        self.assertGreater(rate.slack, 0.0)
+        self.assertLess(wakeups[0], 5)  # polling every 10 us takes dozens
+
+    async def test_sleep_until_next_tick(self):
+        """Sleep until the next tick without blocking."""
+        await self.rate.sleep_until_next_tick()
+        await self.rate.sleep_until_next_tick()
+        self.assertGreater(self.rate.slack, 0.0)
+        self.assertGreater(self.rate.measured_period, 0.5 * self.rate.period)
+
+
+class TestAsyncRateLimiterNotRunning(unittest.TestCase):
+    def test_not_running(self):
+        """Raise when initialized outside of a running event loop."""
+        with self.assertRaises(RuntimeError):
+            AsyncRateLimiter(1000.0)
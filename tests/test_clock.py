@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Stéphane Caron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test absolute-deadline sleep.
+"""
+
+import time
+import unittest
+
+from loop_rate_limiters._clock import sleep_until, yield_cpu
+
+
+class TestSleepUntil(unittest.TestCase):
+    def test_future_deadline(self):
+        """Wake up after the deadline."""
+        deadline = time.perf_counter() + 1e-3
+        sleep_until(deadline)
+        self.assertGreaterEqual(time.perf_counter(), deadline)
+
+    def test_past_deadline(self):
+        """Return right away when the deadline has passed."""
+        start = time.perf_counter()
+        sleep_until(start - 1.0)
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+
+class TestYieldCPU(unittest.TestCase):
+    def test_yield_cpu(self):
+        """Yielding the CPU returns."""
+        yield_cpu()
@@ -34,15 +34,38 @@ class TestRate(unittest.TestCase):
         """Constructor completed."""
         self.assertIsNotNone(self.rate)
 
+    def test_frequency(self):
+        """Frequency matches the period."""
+        self.assertAlmostEqual(self.rate.frequency, 1000.0)
+        self.assertAlmostEqual(self.rate.frequency * self.rate.period, 1.0)
+
+    def test_invalid_frequency(self):
+        """Frequencies must be positive."""
+        for frequency in (-1.0, 0.0, float("nan")):
+            with self.assertRaises(ValueError):
+                RateLimiter(frequency=frequency)
+
     def test_next_tick(self):
         call_tick = time.perf_counter()
         self.rate.sleep()
         self.assertGreaterEqual(self.rate.next_tick, call_tick + self.rate.dt)
 
+    def test_next_tick_grid(self):
+        """Ticks are spaced by exactly one period when calls are on time."""
+        rate = RateLimiter(frequency=100.0)
+        first_tick = rate.next_tick
+        rate.sleep()
+        rate.sleep()
+        self.assertAlmostEqual(rate.next_tick, first_tick + 2 * rate.period)
+
     def test_period_dt(self):
         """Check that period and dt are the same."""
         self.assertAlmostEqual(self.rate.period, self.rate.dt)
 
+    def test_slots(self):
+        """Rate limiters don't carry a per-instance dictionary."""
+        self.assertFalse(hasattr(self.rate, "__dict__"))
+
     def test_remaining(self):
         """
         After one period has expired, the "remaining" time becomes negative.
@@ -66,3 +89,96 @@ class TestRate(unittest.TestCase):
         self.rate.sleep()  # presumably slack > 0.0
         time.sleep(self.rate.period)
         self.rate.sleep()  # now for sure slack < 0.0
+
+    def test_sleep_precise(self):
+        """Precise sleeps wake up no earlier than the next tick."""
+        next_tick = self.rate.next_tick
+        self.rate.sleep_precise()
+        self.assertGreaterEqual(time.perf_counter(), next_tick)
+        self.rate.sleep_precise()  # presumably slack > 0.0
+        time.sleep(self.rate.period)
+        self.rate.sleep_precise()  # now for sure slack < 0.0
+        self.assertLess(self.rate.slack, 0.0)
+
+    def test_warn_when_late(self):
+        """Log a warning when a call comes more than 10% late."""
+        self.rate.sleep()
+        time.sleep(2 * self.rate.period)
+        with self.assertLogs("loop_rate_limiters", level="WARNING"):
+            self.rate.sleep()
+
+    def test_warn_backoff(self):
+        """Warnings are spaced exponentially under sustained overruns."""
+        self.rate.sleep()
+        with self.assertLogs("loop_rate_limiters", level="WARNING") as logs:
+            for _ in range(6):
+                time.sleep(2 * self.rate.period)
+                self.rate.sleep()
+        self.assertEqual(len(logs.records), 3)
+
+    def test_adaptive_increase(self):
+        """Adaptive rate limiters slow down after late calls."""
+        rate = RateLimiter(frequency=1000.0, warn=False, adaptive=True)
+        rate.sleep()
+        time.sleep(2 * rate.period)
+        rate.sleep()
+        self.assertAlmostEqual(rate.period, 2e-3)
+        self.assertAlmostEqual(rate.frequency, 500.0)
+        self.assertAlmostEqual(rate.target_frequency, 1000.0)
+
+    def test_adaptive_bounds(self):
+        """Adaptive periods stay between their minimum and maximum."""
+        rate = RateLimiter(
+            frequency=1000.0,
+            warn=False,
+            adaptive=True,
+            alpha=1e-4,
+            max_period=1.5e-3,
+        )
+        rate.sleep()
+        time.sleep(2 * rate.period)
+        rate.sleep()
+        self.assertAlmostEqual(rate.period, 1.5e-3)
+        rate.sleep()  # presumably slack > 0.0
+        self.assertAlmostEqual(rate.period, 1.5e-3 - 1e-4)
+
+    def test_adaptive_period_out_of_bounds(self):
+        """The desired period must lie between the minimum and maximum."""
+        with self.assertRaises(ValueError):
+            RateLimiter(
+                frequency=1000.0,
+                adaptive=True,
+                min_period=1e-4,
+                max_period=5e-4,
+            )
+        with self.assertRaises(ValueError):
+            RateLimiter(frequency=1000.0, adaptive=True, min_period=2e-3)
+
+    def test_adaptive_invalid_beta(self):
+        """Multiplicative factors must be between zero and one."""
+        for beta in (0.0, 1.0, 2.0):
+            with self.assertRaises(ValueError):
+                RateLimiter(frequency=1000.0, adaptive=True, beta=beta)
+
+    def test_adaptive_invalid_alpha(self):
+        """Additive decreases must be non-negative."""
+        with self.assertRaises(ValueError):
+            RateLimiter(frequency=1000.0, adaptive=True, alpha=-1e-5)
+
+    def test_adaptive_invalid_min_period(self):
+        """Minimum periods must be positive."""
+        for min_period in (0.0, -1e-3):
+            with self.assertRaises(ValueError):
+                RateLimiter(
+                    frequency=1000.0, adaptive=True, min_period=min_period
+                )
+
+    def test_adaptive_invalid_period_bounds(self):
+        """Minimum periods must not exceed maximum periods."""
+        with self.assertRaises(ValueError):
+            RateLimiter(
+                frequency=1000.0,
+                adaptive=True,
+                min_period=5e-3,
+                max_period=1e-3,
+            )
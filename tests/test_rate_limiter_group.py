@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Copyright 2022 Stéphane Caron
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test rate limiter group.
+"""
+
+import time
+import unittest
+from unittest import mock
+
+from loop_rate_limiters import RateLimiterGroup
+
+
+class TestRateLimiterGroup(unittest.TestCase):
+    def setUp(self):
+        """Initialize a group with 1 ms and 10 ms periods."""
+        self.group = RateLimiterGroup([1000.0, 100.0])
+
+    def test_init(self):
+        """Constructor completed."""
+        self.assertEqual(len(self.group), 2)
+        self.assertAlmostEqual(self.group.periods[0], 1e-3)
+        self.assertAlmostEqual(self.group.periods[1], 1e-2)
+
+    def test_sleep(self):
+        """The fastest loop is due first."""
+        call_tick = time.perf_counter()
+        self.assertEqual(self.group.sleep(), [0])
+        self.assertGreaterEqual(time.perf_counter(), call_tick)
+
+    def test_all_due(self):
+        """All loops are due when they are late."""
+        time.sleep(2e-2)
+        self.assertEqual(self.group.sleep(), [0, 1])
+        now = time.perf_counter()
+        for next_tick in self.group.next_ticks:
+            self.assertGreater(next_tick, now - 1e-3)
+
+    def test_coinciding_ticks(self):
+        """Loops whose ticks coincide are due together."""
+        clock = [12345.678]
+
+        def perf_counter():
+            return clock[0]
+
+        def sleep_until(deadline):
+            clock[0] = max(clock[0], deadline)
+
+        with mock.patch(
+            "loop_rate_limiters.rate_limiter_group.perf_counter",
+            perf_counter,
+        ):
+            group = RateLimiterGroup([1000.0, 100.0])
+        for cycle in range(1, 301):
+            due = group.sleep(perf_counter, sleep_until)
+            clock[0] += 2e-4  # callback work
+            self.assertEqual(due, [0, 1] if cycle % 10 == 0 else [0])
+        self.assertAlmostEqual(clock[0], 12345.678 + 0.3002)
+
+    def test_invalid_frequency(self):
+        """Frequencies must be positive."""
+        for frequency in (-1.0, 0.0, float("nan")):
+            with self.assertRaises(ValueError):
+                RateLimiterGroup([100.0, frequency])
+
+    def test_empty(self):
+        """Groups need at least one loop."""
+        with self.assertRaises(ValueError):
+            RateLimiterGroup([])
+
+    def test_generator(self):
+        """Frequencies can be given by a generator."""
+        group = RateLimiterGroup(f for f in [100.0, 10.0])
+        self.assertEqual(len(group), 2)